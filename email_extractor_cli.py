@@ -26,11 +26,10 @@ python email_extractor_cli.py --ics-file invite.ics --start-date 2023-08-01 --en
 
 import typer
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set
 from email_extractor import (
-    ics_to_dataframe,
-    extract_email_addresses,
-    clean_and_explode_emails,
+    ics_to_events,
+    extract_emails_from_events,
     extract_emails_from_text,
     extract_emails_from_newline_separated_text,
 )
@@ -66,27 +65,25 @@ def extract_emails(
     start_date = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
     end_date = datetime.strptime(end_date, "%Y-%m-%d") if end_date else None
 
-    df = ics_to_dataframe(ics_file, start_date=start_date, end_date=end_date)
-    df = extract_email_addresses(df)
-    df = clean_and_explode_emails(df)
-    emails_from_calendar = list(df.Emails.unique())
+    # The CLI only needs the unique email set, so use the pandas-free
+    # events path rather than building a DataFrame just to throw it away.
+    events = ics_to_events(ics_file, start_date=start_date, end_date=end_date)
+
+    # Accumulate each source directly into one set instead of
+    # concatenating intermediate lists.
+    emails: Set[str] = set()
+    emails |= extract_emails_from_events(events)
 
-    emails_from_last_years_minis: List[str] = []
     if name_email_file:
-        emails_from_last_years_minis = extract_emails_from_text(name_email_file)
+        emails |= extract_emails_from_text(name_email_file)
 
-    emails_from_u_session: List[str] = []
     if newline_email_file:
-        emails_from_u_session = extract_emails_from_newline_separated_text(
-            newline_email_file
-        )
-
-    emails = set(
-        emails_from_u_session + emails_from_calendar + emails_from_last_years_minis
-    )
+        emails.update(extract_emails_from_newline_separated_text(newline_email_file))
 
-    with open(output_file, "w") as file:
-        file.write("\n".join(emails))
+    # Stream the writes instead of joining one big string, so peak
+    # memory stays at the set itself even for very large email lists
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as file:
+        file.writelines(email + "\n" for email in sorted(emails))
 
     typer.echo(f"Email list saved to: {output_file}")
 